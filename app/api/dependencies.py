@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Final, Optional
 
-from fastapi import Path, Query
+from fastapi import Path, Query, Request
 
 from app.config import get_settings
 from app.services.festival_service import FestivalService
@@ -8,14 +8,23 @@ from app.utils.cache import CacheManager
 
 settings = get_settings()
 
-# Thread-safe, pre-allocated private singleton placeholders
+# Validation bounds bound once at import so parameter declarations never walk the settings model
+_MIN_YEAR: Final = settings.MIN_YEAR
+_MAX_YEAR: Final = settings.MAX_YEAR
+_MIN_MONTH: Final = settings.MIN_MONTH
+_MAX_MONTH: Final = settings.MAX_MONTH
+
+# Event-loop-safe, pre-allocated private singleton placeholders
 _cache_manager: Optional[CacheManager] = None
 _festival_service: Optional[FestivalService] = None
 
 
-def get_cache_manager() -> CacheManager:
+async def get_cache_manager() -> CacheManager:
     """
-    Thread-safe lazy initializer for the application cache instance.
+    Lazy initializer for the application cache instance.
+
+    Declared async so FastAPI resolves it inline on the event loop instead of the threadpool.
+    The check-and-set contains no await points, so it runs atomically on the loop.
 
     Returns:
         CacheManager: Active memory ring-buffer caching engine singleton.
@@ -27,17 +36,21 @@ def get_cache_manager() -> CacheManager:
     return _cache_manager
 
 
-def get_festival_service() -> FestivalService:
+async def get_festival_service(request: Request) -> FestivalService:
     """
-    Thread-safe lazy initializer for orchestrating business logic calculations.
+    Lazy initializer for orchestrating business logic calculations.
+
+    The service is rebuilt whenever the lifespan-owned scraper changes, so a restarted
+    application never keeps scraping through a closed connection pool.
 
     Returns:
         FestivalService: Active non-blocking service router instance map.
     """
     global _festival_service
-    if _festival_service is None:
-        cache_instance = get_cache_manager()
-        _festival_service = FestivalService(cache_manager=cache_instance)
+    scraper = getattr(request.app.state, "scraper", None)
+    if _festival_service is None or (scraper is not None and _festival_service.scraper is not scraper):
+        cache_instance = await get_cache_manager()
+        _festival_service = FestivalService(cache_manager=cache_instance, scraper=scraper)
     return _festival_service
 
 
@@ -45,11 +58,11 @@ def get_festival_service() -> FestivalService:
 # FASTAPI INPUT PARAMETERS VALIDATION STRUCTS
 # ==============================================================================
 
-def year_path(
+async def year_path(
         year: int = Path(
             ...,
-            ge=settings.MIN_YEAR,
-            le=settings.MAX_YEAR,
+            ge=_MIN_YEAR,
+            le=_MAX_YEAR,
             description="The target calendar year constraint for querying festival arrays.",
             examples=[2026]  # Modern FastAPI PEP-compliant list definition format
         )
@@ -58,11 +71,11 @@ def year_path(
     return year
 
 
-def month_path(
+async def month_path(
         month: int = Path(
             ...,
-            ge=settings.MIN_MONTH,
-            le=settings.MAX_MONTH,
+            ge=_MIN_MONTH,
+            le=_MAX_MONTH,
             description="The numerical target month signature index parameters (Bounded 1 to 12).",
             examples=[1]
         )
@@ -71,11 +84,11 @@ def month_path(
     return month
 
 
-def month_query(
+async def month_query(
         month: Optional[int] = Query(
             None,
-            ge=settings.MIN_MONTH,
-            le=settings.MAX_MONTH,
+            ge=_MIN_MONTH,
+            le=_MAX_MONTH,
             description="Optional query parameter layer to selectively slice data to a precise monthly index.",
             examples=[1]
         )
@@ -1,7 +1,8 @@
 import logging
-from typing import Optional, Dict, List
+from datetime import datetime, timezone
+from typing import Final, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 
 from app.api.dependencies import (
     get_festival_service,
@@ -14,8 +15,7 @@ from app.middleware.rate_limiter import limiter
 from app.models.schemas import (
     FestivalsResponse,
     ReligiousFestivalsResponse,
-    ErrorResponse,
-    FestivalItem
+    ErrorResponse
 )
 from app.services.festival_service import FestivalService
 
@@ -25,34 +25,73 @@ settings = get_settings()
 
 router = APIRouter()
 
-MONTH_NAMES = {
-    1: "January", 2: "February", 3: "March", 4: "April",
-    5: "May", 6: "June", 7: "July", 8: "August",
-    9: "September", 10: "October", 11: "November", 12: "December"
+# Shared per-route rate limit and error documentation, built once at import
+_LIMIT: Final = f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_WINDOW} seconds"
+# Past years never change upstream, so browsers and CDN edges may keep them for a year without revalidating;
+# current and future years follow the origin TTL and may be served stale while the edge refetches
+_PAST_YEAR_CACHE_CONTROL: Final = "public, max-age=31536000, s-maxage=31536000, immutable"
+_CACHE_CONTROL: Final = (
+    f"public, max-age={settings.CACHE_TTL}, s-maxage={settings.CACHE_TTL}, "
+    f"stale-while-revalidate={settings.CACHE_TTL * 4}"
+)
+# Empty payloads may come from a transient upstream failure, so no cache may keep them
+_NO_STORE: Final = "no-store"
+_COMMON_RESPONSES = {
+    400: {"model": ErrorResponse, "description": "Invalid parameter boundaries"},
+    404: {"model": ErrorResponse, "description": "No tracked data records matching constraints found"},
+    429: {"model": ErrorResponse, "description": "Rate limit threshold breached"},
+    500: {"model": ErrorResponse, "description": "Internal cluster runtime exception"}
 }
 
 
-def convert_to_festival_items(festivals_dict: Dict[str, List[dict]]) -> Dict[str, List[FestivalItem]]:
-    """Converts raw dictionary responses efficiently into immutable validation-hardened FestivalItem models."""
-    return {
-        month_name: [FestivalItem(**festival) for festival in festivals]
-        for month_name, festivals in festivals_dict.items()
-    }
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Checks an If-None-Match header (single, listed, weak or wildcard validators) against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, ignoring any W/ prefix on either side.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
+
+
+def json_body_response(
+        request: Request,
+        year: int,
+        body: bytes,
+        etag: str,
+        cache_hit: bool,
+        cacheable: bool = True
+) -> Response:
+    """
+    Wraps a pre-serialized JSON body, short-circuiting to 304 Not Modified when the client's copy is current.
+
+    Bypasses response-model re-validation and jsonable_encoder; the Pydantic schemas remain
+    attached to each route through `responses` purely for OpenAPI documentation.
+    Uncacheable (empty) payloads are sent with no-store so browsers and CDN edges never pin them.
+    """
+    if not cacheable:
+        cache_control = _NO_STORE
+    elif year < datetime.now(timezone.utc).year:
+        cache_control = _PAST_YEAR_CACHE_CONTROL
+    else:
+        cache_control = _CACHE_CONTROL
+    headers = {"ETag": etag, "Cache-Control": cache_control, "X-Cache": "HIT" if cache_hit else "MISS"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get(
     "/festivals/{year}",
-    response_model=FestivalsResponse,
-    responses={
-        400: {"model": ErrorResponse, "description": "Invalid parameter boundaries"},
-        404: {"model": ErrorResponse, "description": "No tracked data records matching constraints found"},
-        429: {"model": ErrorResponse, "description": "Rate limit threshold breached"},
-        500: {"model": ErrorResponse, "description": "Internal cluster runtime exception"}
-    },
+    responses={200: {"model": FestivalsResponse, "description": "Successful Response"}, **_COMMON_RESPONSES},
     summary="Get all festivals for a year",
     description="Retrieve all Indian festivals and holidays for a specific year, optionally filtered by month query parameters."
 )
-@limiter.limit(f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_WINDOW} seconds")
+@limiter.limit(_LIMIT)
 # noinspection PyUnusedLocal
 async def get_festivals(
         request: Request,
@@ -62,20 +101,8 @@ async def get_festivals(
 ):
     """Retrieves yearly master lists using high-performance non-blocking async execution loops."""
     try:
-        festivals = await service.get_festivals(year=year, month=month)
-
-        if not festivals:
-            if month:
-                month_name = MONTH_NAMES.get(month, "January")
-                festivals = {month_name: []}
-            else:
-                festivals = {}
-
-        return FestivalsResponse(
-            year=year,
-            month=month,
-            festivals=convert_to_festival_items(festivals)
-        )
+        body, etag, cache_hit, cacheable = await service.get_body("festivals", year=year, month=month)
+        return json_body_response(request, year, body, etag, cache_hit=cache_hit, cacheable=cacheable)
     except HTTPException:
         raise
     except Exception as e:
@@ -88,17 +115,11 @@ async def get_festivals(
 
 @router.get(
     "/festivals/{year}/month/{month}",
-    response_model=FestivalsResponse,
-    responses={
-        400: {"model": ErrorResponse, "description": "Invalid parameter boundaries"},
-        404: {"model": ErrorResponse, "description": "No tracked data records matching constraints found"},
-        429: {"model": ErrorResponse, "description": "Rate limit threshold breached"},
-        500: {"model": ErrorResponse, "description": "Internal cluster runtime exception"}
-    },
+    responses={200: {"model": FestivalsResponse, "description": "Successful Response"}, **_COMMON_RESPONSES},
     summary="Get festivals for a specific month",
     description="Retrieve Indian festivals and holidays targeted explicitly to a specific year and monthly integer path."
 )
-@limiter.limit(f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_WINDOW} seconds")
+@limiter.limit(_LIMIT)
 # noinspection PyUnusedLocal
 async def get_festivals_by_month(
         request: Request,
@@ -108,17 +129,8 @@ async def get_festivals_by_month(
 ):
     """Retrieves clean monthly calendar indexes non-blockingly."""
     try:
-        festivals = await service.get_festivals(year=year, month=month)
-
-        if not festivals:
-            month_name = MONTH_NAMES.get(month, "January")
-            festivals = {month_name: []}
-
-        return FestivalsResponse(
-            year=year,
-            month=month,
-            festivals=convert_to_festival_items(festivals)
-        )
+        body, etag, cache_hit, cacheable = await service.get_body("festivals", year=year, month=month)
+        return json_body_response(request, year, body, etag, cache_hit=cache_hit, cacheable=cacheable)
     except HTTPException:
         raise
     except Exception as e:
@@ -131,17 +143,11 @@ async def get_festivals_by_month(
 
 @router.get(
     "/festivals/{year}/religious",
-    response_model=ReligiousFestivalsResponse,
-    responses={
-        400: {"model": ErrorResponse, "description": "Invalid parameter boundaries"},
-        404: {"model": ErrorResponse, "description": "No tracked data records matching constraints found"},
-        429: {"model": ErrorResponse, "description": "Rate limit threshold breached"},
-        500: {"model": ErrorResponse, "description": "Internal cluster runtime exception"}
-    },
+    responses={200: {"model": ReligiousFestivalsResponse, "description": "Successful Response"}, **_COMMON_RESPONSES},
     summary="Get religious festivals for a year",
     description="Retrieve religious festivals organized by localized beliefs (Hindu, Sikh, Christian, Islamic, or Gov Holidays)."
 )
-@limiter.limit(f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_WINDOW} seconds")
+@limiter.limit(_LIMIT)
 # noinspection PyUnusedLocal
 async def get_religious_festivals(
         request: Request,
@@ -151,13 +157,8 @@ async def get_religious_festivals(
 ):
     """Retrieves religious arrays mapped synchronously to multi-core workers."""
     try:
-        religious_festivals = await service.get_religious_festivals(year=year, month=month)
-
-        return ReligiousFestivalsResponse(
-            year=year,
-            month=month,
-            religious_festivals=convert_to_festival_items(religious_festivals)
-        )
+        body, etag, cache_hit, cacheable = await service.get_body("religious", year=year, month=month)
+        return json_body_response(request, year, body, etag, cache_hit=cache_hit, cacheable=cacheable)
     except HTTPException:
         raise
     except Exception as e:
@@ -170,17 +171,11 @@ async def get_religious_festivals(
 
 @router.get(
     "/festivals/{year}/religious/month/{month}",
-    response_model=ReligiousFestivalsResponse,
-    responses={
-        400: {"model": ErrorResponse, "description": "Invalid parameter boundaries"},
-        404: {"model": ErrorResponse, "description": "No tracked data records matching constraints found"},
-        429: {"model": ErrorResponse, "description": "Rate limit threshold breached"},
-        500: {"model": ErrorResponse, "description": "Internal cluster runtime exception"}
-    },
+    responses={200: {"model": ReligiousFestivalsResponse, "description": "Successful Response"}, **_COMMON_RESPONSES},
     summary="Get religious festivals for a specific month",
     description="Retrieve religious festivals grouped explicitly by faith denomination matching a specific year and month."
 )
-@limiter.limit(f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_WINDOW} seconds")
+@limiter.limit(_LIMIT)
 # noinspection PyUnusedLocal
 async def get_religious_festivals_by_month(
         request: Request,
@@ -190,13 +185,8 @@ async def get_religious_festivals_by_month(
 ):
     """Retrieves specialized religious metadata sub-arrays safely."""
     try:
-        religious_festivals = await service.get_religious_festivals(year=year, month=month)
-
-        return ReligiousFestivalsResponse(
-            year=year,
-            month=month,
-            religious_festivals=convert_to_festival_items(religious_festivals)
-        )
+        body, etag, cache_hit, cacheable = await service.get_body("religious", year=year, month=month)
+        return json_body_response(request, year, body, etag, cache_hit=cache_hit, cacheable=cacheable)
     except HTTPException:
         raise
     except Exception as e:
@@ -22,9 +22,12 @@ class Settings(BaseSettings):
     # Rate Limiting Defenses
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_WINDOW: int = 60  # seconds
+    RATE_LIMIT_STRATEGY: str = "moving-window"  # Smooths bursts; avoids the 2x fixed-window boundary spike
+    RATE_LIMIT_STORAGE_URI: str = "memory://"  # Use "redis://host:6379" to share counters across workers
 
     # Cache Layer Lifespan
     CACHE_TTL: int = 3600  # 1 hour in seconds
+    CACHE_REFRESH_WINDOW: float = 0.1  # Fraction of TTL left when a background refresh kicks in
 
     # Secure Cross-Origin Resource Sharing (CORS)
     CORS_ORIGINS: list[str] = ["https://praveenyadavme.vercel.app"]
@@ -1,5 +1,3 @@
-import hashlib
-import json
 import logging
 import time
 from typing import Any, Optional
@@ -12,14 +10,13 @@ class CacheManager:
 
     def __init__(self, default_ttl: int = 3600):
         """Initialize cache with default TTL."""
-        self._cache = {}
+        self._cache: dict[tuple, tuple[Any, float]] = {}
         self.default_ttl = default_ttl
 
     @staticmethod
-    def _generate_key(**kwargs) -> str:
+    def _generate_key(**kwargs) -> tuple:
         """Generate cache key from parameters."""
-        key_string = json.dumps(kwargs, sort_keys=True)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return tuple(sorted(kwargs.items()))
 
     def get(self, **kwargs) -> Optional[Any]:
         """Get value from cache."""
@@ -30,14 +27,14 @@ class CacheManager:
 
             # Check if cache entry is still valid
             if time.time() < expiry:
-                logger.debug(f"Cache hit for key: {key}")
+                logger.debug("Cache hit for key: %s", key)
                 return value
             else:
                 # Remove expired entry
                 del self._cache[key]
-                logger.debug(f"Cache expired for key: {key}")
+                logger.debug("Cache expired for key: %s", key)
 
-        logger.debug(f"Cache miss for key: {key}")
+        logger.debug("Cache miss for key: %s", key)
         return None
 
     def set(self, value: Any, ttl: Optional[int] = None, **kwargs) -> None:
@@ -45,7 +42,7 @@ class CacheManager:
         key = self._generate_key(**kwargs)
         expiry = time.time() + (ttl or self.default_ttl)
         self._cache[key] = (value, expiry)
-        logger.debug(f"Cache set for key: {key}")
+        logger.debug("Cache set for key: %s", key)
 
     def clear(self) -> None:
         """Clear all cache entries."""
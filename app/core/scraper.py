@@ -1,12 +1,38 @@
 import logging
-from collections import OrderedDict
-from typing import Dict, List, Optional
+import re
+from typing import Dict, List, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session so repeated scrapes reuse pooled TCP/TLS connections
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2))
+)
+_SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+
+# Hex color inside a style attribute, skipping look-alikes such as background-color
+_COLOR_RE = re.compile(r"(?<![\w-])color\s*:\s*(#[0-9a-f]{6})", re.IGNORECASE)
+
+
+def _parse_row(row: Tag) -> Optional[Tuple[str, str, Tag]]:
+    """Splits a calendar row into its date, weekday and festival-name cell, or None when malformed."""
+    cells = row.find_all('td')
+    if len(cells) < 2:
+        return None
+
+    date_parts = cells[0].text.split()
+    if len(date_parts) < 2:
+        return None
+
+    return date_parts[0], date_parts[1], cells[1]
+
 
 class IndianFestivalsScraper:
     """Scraper for Indian festivals from panchang.astrosage.com"""
@@ -19,8 +45,8 @@ class IndianFestivalsScraper:
 
     FESTIVAL_COLORS = {
         "#a60000": "Hindu Festivals",
-        "#4A3475": "Government Holidays",
-        "#556A21": "Sikh Festivals",
+        "#4a3475": "Government Holidays",
+        "#556a21": "Sikh Festivals",
         "#d42426": "Christian Holidays",
         "#008000": "Islamic Holidays"
     }
@@ -40,27 +66,29 @@ class IndianFestivalsScraper:
 
         try:
             url = f"{self.base_url}?language=en&date={self.year}"
-            logger.info(f"Fetching data from {url}")
+            logger.info("Fetching data from %s", url)
 
-            response = requests.get(url, timeout=self.timeout)
+            response = _SESSION.get(url, timeout=self.timeout)
             response.raise_for_status()
 
             self._soup = BeautifulSoup(response.text, 'html.parser')
             self._tables = self._soup.find_all('table')
 
-            logger.info(f"Successfully fetched data for year {self.year}. Found {len(self._tables)} tables")
+            logger.info("Successfully fetched data for year %s. Found %d tables", self.year, len(self._tables))
         except requests.RequestException as e:
-            logger.error(f"Error fetching data: {str(e)}")
+            logger.error("Error fetching data: %s", e)
             raise
 
     def get_festivals(self, month: Optional[int] = None) -> Dict[str, List[Dict]]:
         """Get all festivals for the year, optionally filtered by month."""
         self._fetch_data()
 
-        festivals = OrderedDict()
+        festivals = {}
         target_month_name = self.MONTHS.get(month) if month else None
 
-        logger.info(f"Processing festivals. Target month: {target_month_name}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        logger.info("Processing festivals. Target month: %s", target_month_name)
 
         for table in self._tables:
             try:
@@ -79,7 +107,8 @@ class IndianFestivalsScraper:
                 if not month_name:
                     continue
 
-                logger.debug(f"Processing table for month: {month_name}")
+                if debug_enabled:
+                    logger.debug("Processing table for month: %s", month_name)
 
                 # Skip if filtering by month and this isn't the target month
                 if target_month_name and month_name != target_month_name:
@@ -90,60 +119,43 @@ class IndianFestivalsScraper:
                 if not tbody:
                     continue
 
-                rows = tbody.find_all('tr')
-                month_festivals = []
-
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) >= 2:
-                        try:
-                            date_cell = cells[0].text.strip()
-                            name_cell = cells[1].text.strip()
-
-                            if not date_cell or not name_cell:
-                                continue
-
-                            date_parts = date_cell.split()
-                            if len(date_parts) >= 2:
-                                festival = {
-                                    "date": date_parts[0],
-                                    "day": date_parts[1],
-                                    "name": name_cell
-                                }
-                                month_festivals.append(festival)
-                                logger.debug(f"Added festival: {festival}")
-                        except (IndexError, AttributeError) as e:
-                            logger.debug(f"Error parsing row: {e}")
-                            continue
+                month_festivals = [
+                    {"date": date, "day": day, "name": name}
+                    for date, day, name_cell in filter(None, map(_parse_row, tbody.find_all('tr')))
+                    if (name := name_cell.text.strip())
+                ]
 
                 if month_festivals:
                     festivals[month_name] = month_festivals
-                    logger.info(f"Found {len(month_festivals)} festivals for {month_name}")
+                    if debug_enabled:
+                        logger.debug("Added %d festivals for %s", len(month_festivals), month_name)
 
                 # If filtering by month and found it, we can break
                 if target_month_name and month_name == target_month_name:
-                    logger.info(f"Found target month {target_month_name}, breaking loop")
+                    logger.debug("Found target month %s, breaking loop", target_month_name)
                     break
 
             except (AttributeError, IndexError) as e:
-                logger.warning(f"Error parsing table: {str(e)}")
+                logger.warning("Error parsing table: %s", e)
                 continue
 
-        logger.info(f"Total months with festivals: {len(festivals)}")
-        return dict(festivals)
+        logger.info(
+            "Total months with festivals: %d (%d festivals)",
+            len(festivals), sum(len(month_festivals) for month_festivals in festivals.values())
+        )
+        return festivals
 
     def get_religious_festivals(self, month: Optional[int] = None) -> Dict[str, List[Dict]]:
         """Get religious festivals organized by religion."""
         self._fetch_data()
 
-        religious_festivals = OrderedDict()
+        # Every religion category is present, even when it has no festivals this period
+        religious_festivals = {religion: [] for religion in self.FESTIVAL_COLORS.values()}
         target_month_name = self.MONTHS.get(month) if month else None
 
-        # Initialize all religion categories
-        for religion in self.FESTIVAL_COLORS.values():
-            religious_festivals[religion] = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
-        logger.info(f"Processing religious festivals. Target month: {target_month_name}")
+        logger.info("Processing religious festivals. Target month: %s", target_month_name)
 
         for table in self._tables:
             try:
@@ -162,7 +174,8 @@ class IndianFestivalsScraper:
                 if not month_name:
                     continue
 
-                logger.debug(f"Processing religious festivals for month: {month_name}")
+                if debug_enabled:
+                    logger.debug("Processing religious festivals for month: %s", month_name)
 
                 # Skip if filtering by month
                 if target_month_name and month_name != target_month_name:
@@ -173,69 +186,49 @@ class IndianFestivalsScraper:
                 if not tbody:
                     continue
 
-                rows = tbody.find_all('tr')
-
-                for row in rows:
-                    cells = row.find_all('td')
-                    if len(cells) < 2:
-                        continue
-
+                for parsed_row in filter(None, map(_parse_row, tbody.find_all('tr'))):
                     try:
-                        date_cell = cells[0].text.strip()
-
-                        if not date_cell:
-                            continue
-
-                        date_parts = date_cell.split()
-                        if len(date_parts) < 2:
-                            continue
-
-                        date_info = {
-                            "date": date_parts[0],
-                            "day": date_parts[1]
-                        }
-
-                        if not target_month_name:
-                            date_info["month"] = month_name
+                        # Hoisted once per row; each matched tag builds its dict in one literal
+                        date, day, name_cell = parsed_row
+                        festival_month = None if target_month_name else month_name
 
                         # Check for styled tags (bold and links)
-                        styled_tags = cells[1].find_all(['b', 'a'])
+                        styled_tags = name_cell.find_all(['b', 'a'])
 
                         for tag in styled_tags:
-                            style = tag.get('style', '')
-                            if not style or ':' not in style:
-                                continue
-
-                            # Extract color from style
-                            color_parts = style.split(':')
-                            if len(color_parts) < 2:
+                            color_match = _COLOR_RE.search(tag.get('style', ''))
+                            if not color_match:
                                 continue
 
-                            color = color_parts[1].strip().rstrip(';')
-                            religion = self.FESTIVAL_COLORS.get(color)
+                            religion = self.FESTIVAL_COLORS.get(color_match.group(1).lower())
 
                             if religion:
-                                festival = date_info.copy()
-                                festival["name"] = tag.text.strip()
+                                name = tag.text.strip()
+                                if festival_month:
+                                    festival = {"date": date, "day": day, "month": festival_month, "name": name}
+                                else:
+                                    festival = {"date": date, "day": day, "name": name}
                                 religious_festivals[religion].append(festival)
-                                logger.debug(f"Added {religion} festival: {festival}")
+                                if debug_enabled:
+                                    logger.debug("Added %s festival: %r", religion, festival)
 
                     except (IndexError, AttributeError) as e:
-                        logger.debug(f"Error parsing religious festival row: {e}")
+                        logger.debug("Error parsing religious festival row: %s", e)
                         continue
 
                 # If filtering by month and found it, break
                 if target_month_name and month_name == target_month_name:
-                    logger.info(f"Found target month {target_month_name} for religious festivals")
+                    logger.debug("Found target month %s for religious festivals", target_month_name)
                     break
 
             except (AttributeError, IndexError) as e:
-                logger.warning(f"Error parsing religious festivals: {str(e)}")
+                logger.warning("Error parsing religious festivals: %s", e)
                 continue
 
         # Log counts
-        for religion, fests in religious_festivals.items():
-            if fests:
-                logger.info(f"Found {len(fests)} {religion}")
+        logger.info(
+            "Religious festival counts: %s",
+            ", ".join(f"{religion}={len(fests)}" for religion, fests in religious_festivals.items() if fests)
+        )
 
-        return dict(religious_festivals)
+        return religious_festivals
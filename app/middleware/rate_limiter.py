@@ -32,10 +32,15 @@ def production_rate_limit_key(request: Request) -> str:
 
 
 # Create and pre-configure the unified global Limiter instance
-# Explicitly uses the production-ready string format layout matching Pydantic metrics
+# Explicitly uses the production-ready string format layout matching Pydantic metrics.
+# The moving-window strategy counts hits over a rolling window, and a shared storage backend
+# (e.g. Redis) lets every uvicorn worker enforce one budget; memory limits take over if it is unreachable.
 limiter = Limiter(
     key_func=production_rate_limit_key,
-    default_limits=[f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_WINDOW} seconds"]
+    default_limits=[f"{settings.RATE_LIMIT_REQUESTS}/{settings.RATE_LIMIT_WINDOW} seconds"],
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    in_memory_fallback_enabled=True
 )
 
 
@@ -1,56 +1,122 @@
+import asyncio
+import contextlib
+import hashlib
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
 
 from app.config import get_settings
-from app.services.scraper import IndianFestivalsScraper
+from app.models.schemas import MONTHS
+from app.services.scraper import IndianFestivalsScraper, YearData
 from app.utils.cache import CacheManager
 
 logger = logging.getLogger("uvicorn.error")
 settings = get_settings()
 
+# Collection kind -> (position in the cached year-data triple, month filter, response payload field)
+_COLLECTIONS = {
+    "festivals": (0, IndianFestivalsScraper.filter_festivals, "festivals"),
+    "religious": (1, IndianFestivalsScraper.filter_religious_festivals, "religious_festivals")
+}
+
 
 class FestivalService:
     """Production-grade asynchronous service layer for orchestrating cached festival operations."""
 
-    def __init__(self, cache_manager: CacheManager):
+    def __init__(self, cache_manager: CacheManager, scraper: Optional[IndianFestivalsScraper] = None):
         """
         Initialize festival service.
 
         Args:
             cache_manager (CacheManager): Active thread-safe cache buffer singleton.
+            scraper (Optional[IndianFestivalsScraper]): Shared scraper owned by the application lifespan;
+                a standalone one with per-fetch connections is created when omitted.
         """
         self.cache = cache_manager
         self.settings = settings
-
-    async def get_festivals(self, year: int, month: Optional[int] = None) -> Dict[str, List[Dict]]:
-        """
-        Retrieves monthly structured festival records from cache or asynchronous live scraper routines.
+        self.scraper = scraper or IndianFestivalsScraper(timeout=self.settings.SCRAPER_TIMEOUT)
+        # In-flight scrape tasks per year, shared by concurrent cache misses
+        self._inflight: Dict[int, asyncio.Task] = {}
+        # Small front tier for the hottest encoded bodies, touched only from the event loop;
+        # hits skip the shared cache's lock, key building and per-lookup logging. Never outlives the
+        # calendar entry's hard expiry
+        self._l1: TTLCache = TTLCache(maxsize=64, ttl=min(60, self.settings.CACHE_TTL))
+
+    async def _get_year_data(self, year: int) -> YearData:
         """
-        cache_params = {"type": "festivals", "year": year, "month": month}
+        Retrieves the full-year festival and religious collections with their data fingerprint,
+        scraping upstream at most once per TTL.
 
-        # 1. Thread-safe internal memory retrieval check
-        cached = self.cache.get(**cache_params)
+        Both collections share one entry keyed on the year alone, so every month filter is served from it.
+        """
+        # 1. Thread-safe internal memory retrieval check; near-expiry hits are served stale while refreshing
+        cached = self.cache.get(type="festival_calendar", year=year)
         if cached is not None:
+            self.revalidate_if_stale(year)
             return cached
 
-        # 2. Asynchronous execution loop if cache layer misses
+        # 2. Coalesce concurrent misses onto a single in-flight scrape for this year.
+        # Shielded so a disconnecting client never cancels the fetch other requests are awaiting
+        return await asyncio.shield(self._start_scrape(year))
+
+    def _start_scrape(self, year: int) -> asyncio.Task:
+        """
+        Returns the in-flight scrape task for a year, starting one if none is running.
+
+        The in-flight map doubles as a per-year lock: the lookup and registration contain no
+        await point, so they run atomically on the event loop and at most one scrape per year exists.
+        """
+        task = self._inflight.get(year)
+        if task is None:
+            task = asyncio.create_task(self._scrape_year(year))
+            self._inflight[year] = task
+            task.add_done_callback(lambda t: self._finish_scrape(year, t))
+        return task
+
+    def _finish_scrape(self, year: int, task: asyncio.Task) -> None:
+        """Releases the year's in-flight slot once its scrape settles."""
+        self._inflight.pop(year, None)
+        # Background refreshes have no awaiter; retrieve the (already logged) error so asyncio stays quiet
+        if not task.cancelled():
+            task.exception()
+
+    def revalidate_if_stale(self, year: int) -> None:
+        """
+        Schedules a background re-scrape when the year's cached data is inside its refresh window.
+
+        The stale entry keeps serving requests until the refresh overwrites it.
+        """
+        if year not in self._inflight and self.cache.is_stale(type="festival_calendar", year=year):
+            logger.info("Refreshing near-expiry festival data for %s in the background", year)
+            self._start_scrape(year)
+
+    async def _scrape_year(self, year: int) -> YearData:
+        """
+        Scrapes both full-year collections from upstream and stores them in the cache layer.
+        """
         try:
-            scraper = IndianFestivalsScraper(
-                year=year,
-                timeout=self.settings.SCRAPER_TIMEOUT
-            )
-            # Await the async scraper execution non-blockingly
-            festivals = await scraper.get_festivals(month=month)
+            # Both collections come from one fused pass over the parsed tables
+            year_data = await self.scraper.scrape_year(year)
 
-            # 3. Cache the valid returned result dictionary payload object
-            if festivals:
+            # 3. Cache the valid returned collections under a single per-year entry
+            if any(year_data[:2]):
+                ttl = self.settings.CACHE_TTL
                 self.cache.set(
-                    value=festivals,
-                    ttl=self.settings.CACHE_TTL,
-                    **cache_params
+                    value=year_data,
+                    ttl=ttl,
+                    soft_ttl=ttl * (1 - self.settings.CACHE_REFRESH_WINDOW),
+                    type="festival_calendar",
+                    year=year
                 )
+                # Front-tier bodies carry no version, so drop the ones built from the replaced entry
+                for key in [key for key in self._l1 if key[1] == year]:
+                    # TTLCache raises KeyError for entries that expired since the scan; they are gone either way
+                    with contextlib.suppress(KeyError):
+                        del self._l1[key]
 
-            return festivals
+            return year_data
 
         except RuntimeError as e:
             logger.error(f"Upstream provider connection termination during metadata parsing: {str(e)}")
@@ -59,43 +125,57 @@ class FestivalService:
             logger.error(f"Uncaught processing failure inside festival pipeline layer: {str(e)}")
             raise RuntimeError("Internal core engine failure processing downstream collection sets.")
 
-    async def get_religious_festivals(
-            self,
-            year: int,
-            month: Optional[int] = None
-    ) -> Dict[str, List[Dict]]:
+    async def _get(self, kind: str, year: int, month: Optional[int] = None) -> Dict[str, List[Dict]]:
         """
-        Retrieves religious grouped collection arrays from cache layers or live processing engines.
+        Slices one collection kind out of the cached full-year data by month.
         """
-        cache_params = {"type": "religious", "year": year, "month": month}
+        index, month_filter, _ = _COLLECTIONS[kind]
+        year_data = await self._get_year_data(year)
+        return month_filter(year_data[index], month)
 
-        # 1. Thread-safe internal memory retrieval check
-        cached = self.cache.get(**cache_params)
-        if cached is not None:
-            return cached
+    async def get_festivals(self, year: int, month: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """Retrieves monthly structured festival records."""
+        return await self._get("festivals", year, month)
 
-        # 2. Asynchronous execution loop if cache layer misses
-        try:
-            scraper = IndianFestivalsScraper(
-                year=year,
-                timeout=self.settings.SCRAPER_TIMEOUT
-            )
-            # Await the async scraper execution non-blockingly
-            religious_festivals = await scraper.get_religious_festivals(month=month)
+    async def get_religious_festivals(self, year: int, month: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """Retrieves religious grouped collection arrays."""
+        return await self._get("religious", year, month)
 
-            # 3. Cache the valid returned result dictionary payload object
-            if religious_festivals:
-                self.cache.set(
-                    value=religious_festivals,
-                    ttl=self.settings.CACHE_TTL,
-                    **cache_params
-                )
+    async def get_body(self, kind: str, year: int, month: Optional[int] = None) -> Tuple[bytes, str, bool, bool]:
+        """
+        Returns the encoded JSON response body for an endpoint payload, its ETag, whether it was a cache hit,
+        and whether it may be cached at all (empty payloads are never pinned, as they may be a transient scrape).
 
-            return religious_festivals
+        Bodies are keyed on the fingerprint of the extracted year data they were built from: a refresh that
+        finds changed festival data routes to fresh keys, while unchanged data keeps serving the same
+        bytes and ETags. Superseded bodies simply age out of the cache.
+        """
+        l1_key = (kind, year, month)
+        hot = self._l1.get(l1_key)
+        if hot is not None:
+            self.revalidate_if_stale(year)
+            return *hot, True, True
 
-        except RuntimeError as e:
-            logger.error(f"Upstream connection mapping timeout handling religious array sets: {str(e)}")
-            raise e
-        except Exception as e:
-            logger.error(f"Uncaught processing execution exception inside religious service stream: {str(e)}")
-            raise RuntimeError("Internal core engine failure processing downstream collection sets.")
+        year_data = await self._get_year_data(year)
+        index, month_filter, field = _COLLECTIONS[kind]
+        version = year_data[2]
+
+        cached = self.cache.get_raw(type=kind, year=year, month=month, version=version)
+        if cached is not None:
+            self._l1[l1_key] = cached
+            return *cached, True, True
+
+        collection = month_filter(year_data[index], month)
+        cacheable = bool(collection)
+        if not collection and kind == "festivals":
+            collection = {MONTHS[month - 1]: []} if month else {}
+
+        # Encoded once with orjson; the ETag is weak because the compression middleware re-encodes the body
+        body = orjson.dumps({"year": year, "month": month, field: collection})
+        etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if cacheable:
+            self.cache.set_raw(
+                body, etag, ttl=self.settings.CACHE_TTL, type=kind, year=year, month=month, version=version
+            )
+            self._l1[l1_key] = (body, etag)
+        return body, etag, False, cacheable
@@ -1,194 +1,232 @@
+import hashlib
 import logging
-from collections import OrderedDict
-from typing import Dict, List, Optional
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree, html
+
+from app.models.schemas import MONTHS as MONTH_NAMES
 
 logger = logging.getLogger("uvicorn.error")
 
+# Matches the inline CSS text color hex code, ignoring look-alike properties such as background-color
+_COLOR_RE = re.compile(r"(?<![\w-])color\s*:\s*(#[0-9a-f]{6})", re.IGNORECASE)
+
+# Pre-compiled XPath queries evaluated by libxml2 instead of Python-level tree descents
+_TABLES = etree.XPath("//table")
+_MONTH_HEADER = etree.XPath("string(((.//thead)[1]//th)[1])")
+_ROWS = etree.XPath("(.//tbody)[1]//tr")
+_CELLS = etree.XPath(".//td")
+_STYLED_TAGS = etree.XPath(".//*[self::b or self::a]")
+
+
+def _parse_row(row: html.HtmlElement) -> Optional[Tuple[str, str, html.HtmlElement]]:
+    """Splits a calendar row into its date, weekday and festival-name cell, or None when malformed."""
+    cells = _CELLS(row)
+    if len(cells) < 2:
+        return None
+
+    date_parts = cells[0].text_content().split()
+    if len(date_parts) < 2:
+        return None
+
+    return date_parts[0], date_parts[1], cells[1]
+
+
+# Compact row record kept after the DOM is released: (date, day, name, [(religion, festival_name), ...])
+CalendarRow = Tuple[str, str, str, List[Tuple[str, str]]]
+
+# Full-year (festivals, religious_festivals, data_fingerprint) triple produced by a single scrape
+YearData = Tuple[Dict[str, List[Dict]], Dict[str, List[Dict]], str]
+
 
 class IndianFestivalsScraper:
     """Production-grade asynchronous scraper for Indian festivals from panchang.astrosage.com"""
 
-    MONTHS = {
-        1: "January", 2: "February", 3: "March", 4: "April",
-        5: "May", 6: "June", 7: "July", 8: "August",
-        9: "September", 10: "October", 11: "November", 12: "December"
-    }
+    MONTHS = dict(enumerate(MONTH_NAMES, start=1))
 
+    # Keys are normalized to lowercase so matched hex codes resolve with a single dict lookup
     FESTIVAL_COLORS = {
         "#a60000": "Hindu Festivals",
-        "#4A3475": "Government Holidays",
-        "#556A21": "Sikh Festivals",
+        "#4a3475": "Government Holidays",
+        "#556a21": "Sikh Festivals",
         "#d42426": "Christian Holidays",
         "#008000": "Islamic Holidays"
     }
 
-    def __init__(self, year: int, timeout: int = 30):
-        """Initialize scraper parameters."""
-        self.year = year
+    def __init__(self, timeout: int = 30, client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize scraper parameters.
+
+        The instance holds no per-year state, so a single scraper is shared by every request.
+
+        Args:
+            timeout (int): Upstream request timeout in seconds, used when no shared client is supplied.
+            client (Optional[httpx.AsyncClient]): Shared keep-alive client owned by the application lifespan.
+        """
         self.timeout = timeout
+        self.client = client
         self.base_url = "https://panchang.astrosage.com/calendars/indiancalendar"
-        self._tables: Optional[List] = None
 
-    async def _fetch_data(self) -> None:
+    async def _fetch_data(self, year: int) -> List[Tuple[str, List[CalendarRow]]]:
         """Asynchronously fetches and parses raw HTML data without blocking the main event thread."""
-        if self._tables is not None:
-            return
-
-        url = f"{self.base_url}?language=en&date={self.year}"
-        logger.info(f"Asynchronously fetching festival metadata from: {url}")
+        url = f"{self.base_url}?language=en&date={year}"
+        logger.info("Asynchronously fetching festival metadata from: %s", url)
 
         try:
             # Using httpx.AsyncClient ensures non-blocking network I/O
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            if self.client is not None:
+                response = await self.client.get(url)
+            else:
+                async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+                    response = await client.get(url)
+            response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-            self._tables = soup.find_all('table')
-            logger.info(f"Successfully processed HTML metrics. Found {len(self._tables)} monthly tables.")
+            try:
+                # The DOM only lives for the duration of this call; just the compact rows are kept.
+                # Parsed from bytes: lxml refuses str input that carries an XML encoding declaration.
+                months = self._materialize(html.document_fromstring(response.content))
+            except etree.ParserError:
+                # libxml2 rejects empty documents outright; treat them as containing no tables
+                months = []
+            logger.info("Successfully processed HTML metrics. Found %d monthly tables.", len(months))
+            return months
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP status extraction failure for year {self.year}: {e.response.status_code}")
+            logger.error("HTTP status extraction failure for year %s: %s", year, e.response.status_code)
             raise RuntimeError(f"External service responded with error status: {e.response.status_code}")
         except httpx.RequestError as e:
-            logger.error(f"Network transport layer failure on connection target: {str(e)}")
+            logger.error("Network transport layer failure on connection target: %s", e)
             raise RuntimeError("Failed to establish target connection stream with external provider.")
 
-    async def get_festivals(self, month: Optional[int] = None) -> Dict[str, List[Dict]]:
-        """Get all festivals for the year, optionally filtered by month."""
-        await self._fetch_data()
-
-        if not self._tables:
-            return {}
-
-        festivals = OrderedDict()
-        target_month_name = self.MONTHS.get(month) if month else None
-
-        for table in self._tables:
-            try:
-                thead = table.find('thead')
-                if not thead:
-                    continue
-
-                month_header = thead.find('th')
-                if not month_header:
-                    continue
-
-                header_text = month_header.text.strip()
-                month_name = header_text.split()[0] if header_text else None
-
-                if not month_name or (target_month_name and month_name != target_month_name):
-                    continue
-
-                tbody = table.find('tbody')
-                if not tbody:
-                    continue
-
-                month_festivals = []
-                for row in tbody.find_all('tr'):
-                    cells = row.find_all('td')
-                    if len(cells) < 2:
-                        continue
+    def _materialize(self, root: html.HtmlElement) -> List[Tuple[str, List[CalendarRow]]]:
+        """
+        Extracts compact (month_name, rows) tuples from the parsed document.
 
-                    date_cell = cells[0].text.strip()
-                    name_cell = cells[1].text.strip()
-
-                    if not date_cell or not name_cell:
-                        continue
-
-                    date_parts = date_cell.split()
-                    if len(date_parts) >= 2:
-                        month_festivals.append({
-                            "date": date_parts[0],
-                            "day": date_parts[1],
-                            "name": name_cell
-                        })
-
-                if month_festivals:
-                    festivals[month_name] = month_festivals
-
-                if target_month_name and month_name == target_month_name:
-                    break
-
-            except (AttributeError, IndexError) as e:
-                logger.warning(f"Gracefully bypassed malformed data segment row cell: {str(e)}")
-                continue
-
-        return dict(festivals)
-
-    async def get_religious_festivals(self, month: Optional[int] = None) -> Dict[str, List[Dict]]:
-        """Get religious festivals organized by religion categories."""
-        await self._fetch_data()
-
-        if not self._tables:
-            return {}
-
-        religious_festivals = OrderedDict()
-        target_month_name = self.MONTHS.get(month) if month else None
-
-        for religion in self.FESTIVAL_COLORS.values():
-            religious_festivals[religion] = []
-
-        for table in self._tables:
+        Religion colors are resolved here, once per styled tag, so later passes never touch the DOM.
+        """
+        months = []
+        for table in _TABLES(root):
             try:
-                thead = table.find('thead')
-                if not thead:
-                    continue
-
-                month_header = thead.find('th')
-                if not month_header:
-                    continue
-
-                header_text = month_header.text.strip()
-                month_name = header_text.split()[0] if header_text else None
+                header_text = _MONTH_HEADER(table).strip()
+                # Interned so every scrape's month keys and labels point at the canonical MONTHS strings
+                month_name = sys.intern(header_text.split()[0]) if header_text else None
 
-                if not month_name or (target_month_name and month_name != target_month_name):
+                if not month_name:
                     continue
 
-                tbody = table.find('tbody')
-                if not tbody:
-                    continue
-
-                for row in tbody.find_all('tr'):
-                    cells = row.find_all('td')
-                    if len(cells) < 2:
-                        continue
-
-                    date_cell = cells[0].text.strip()
-                    if not date_cell:
-                        continue
-
-                    date_parts = date_cell.split()
-                    if len(date_parts) < 2:
-                        continue
-
-                    date_info = {"date": date_parts[0], "day": date_parts[1]}
-                    if not target_month_name:
-                        date_info["month"] = month_name
+                rows = []
+                for date, day, name_cell in filter(None, map(_parse_row, _ROWS(table))):
+                    tagged = []
 
                     # Process targeted styled inline child tags
-                    for tag in cells[1].find_all(['b', 'a']):
-                        style = tag.get('style', '')
-                        if not style or ':' not in style:
+                    for tag in _STYLED_TAGS(name_cell):
+                        color_match = _COLOR_RE.search(tag.get('style', ''))
+                        if not color_match:
                             continue
 
-                        # Precise split logic parsing for handling semicolon endings securely
-                        color = style.split(':')[1].strip().split(';')[0].strip()
-                        religion_group = self.FESTIVAL_COLORS.get(color)
-
+                        religion_group = self.FESTIVAL_COLORS.get(color_match.group(1).lower())
                         if religion_group:
-                            festival = date_info.copy()
-                            festival["name"] = tag.text.strip()
-                            religious_festivals[religion_group].append(festival)
+                            tagged.append((religion_group, tag.text_content().strip()))
 
-                if target_month_name and month_name == target_month_name:
-                    break
+                    rows.append((date, day, name_cell.text_content().strip(), tagged))
+
+                months.append((month_name, rows))
 
             except (AttributeError, IndexError) as e:
-                logger.warning(f"Bypassed parsing exception trace for collection group element: {str(e)}")
+                logger.warning("Gracefully bypassed malformed data segment row cell: %s", e)
                 continue
 
-        return dict(religious_festivals)
+        return months
+
+    async def scrape_year(self, year: int) -> YearData:
+        """
+        Fetches a year and walks its compact month rows once, building the full-year festival
+        and religious collections together.
+        """
+        months = await self._fetch_data(year)
+        # Fingerprint the extracted rows the payloads are built from, so page markup churn (ads, timestamps,
+        # tokens) never changes it while any festival edit does
+        fingerprint = hashlib.blake2b(orjson.dumps(months), digest_size=8).hexdigest()
+
+        if not months:
+            return {}, {}, fingerprint
+
+        festivals = {}
+        religious_festivals = {religion: [] for religion in self.FESTIVAL_COLORS.values()}
+
+        for month_name, rows in months:
+            # Keys follow FestivalItem field order so payloads serialize without re-validation
+            month_festivals = [
+                {"date": date, "day": day, "name": name, "month": None}
+                for date, day, name, _ in rows
+                if name
+            ]
+
+            for date, day, _, tagged in rows:
+                for religion_group, festival_name in tagged:
+                    religious_festivals[religion_group].append({
+                        "date": date,
+                        "day": day,
+                        "name": festival_name,
+                        "month": month_name
+                    })
+
+            if month_festivals:
+                festivals[month_name] = month_festivals
+
+        # Single summary line instead of per-table logging inside the hot parse loop
+        logger.info(
+            "Parsed %d festivals across %d months and %d religious festivals for year %s.",
+            sum(len(month_festivals) for month_festivals in festivals.values()),
+            len(festivals),
+            sum(len(group) for group in religious_festivals.values()),
+            year
+        )
+
+        return festivals, religious_festivals, fingerprint
+
+    @classmethod
+    def filter_festivals(cls, festivals: Dict[str, List[Dict]], month: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """Slices a full-year festival collection down to a single month."""
+        if not month:
+            return festivals
+
+        month_name = cls.MONTHS[month]
+        if month_name not in festivals:
+            return {}
+        return {month_name: festivals[month_name]}
+
+    @classmethod
+    def filter_religious_festivals(
+            cls,
+            religious_festivals: Dict[str, List[Dict]],
+            month: Optional[int] = None
+    ) -> Dict[str, List[Dict]]:
+        """Slices a full-year religious collection down to a single month."""
+        if not month or not religious_festivals:
+            return religious_festivals
+
+        # Month-filtered payloads blank out the redundant per-item month label
+        month_name = cls.MONTHS[month]
+        return {
+            religion: [
+                {"date": festival["date"], "day": festival["day"], "name": festival["name"], "month": None}
+                for festival in festivals
+                if festival["month"] == month_name
+            ]
+            for religion, festivals in religious_festivals.items()
+        }
+
+    async def get_festivals(self, year: int, month: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """Get all festivals for the year, optionally filtered by month."""
+        festivals, _, _ = await self.scrape_year(year)
+        return self.filter_festivals(festivals, month)
+
+    async def get_religious_festivals(self, year: int, month: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """Get religious festivals organized by religion categories."""
+        _, religious_festivals, _ = await self.scrape_year(year)
+        return self.filter_religious_festivals(religious_festivals, month)
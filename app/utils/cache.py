@@ -1,9 +1,8 @@
-import hashlib
-import json
 import logging
+import random
 import time
 from threading import RLock
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from cachetools import TTLCache
 
@@ -25,18 +24,12 @@ class CacheManager:
         self._lock = RLock()  # Threading lock ensures thread safety during mutation windows
 
     @staticmethod
-    def _generate_key(**kwargs) -> str:
+    def _generate_key(**kwargs) -> tuple:
         """
-        Safely maps key configurations into uniform deterministic MD5 hex keys.
-        Handles nested lists and dicts by stripping string whitespaces.
+        Maps key configurations into a deterministic, hashable tuple key.
+        Sorting the items ensures identical parameter arrangements generate the same key.
         """
-        try:
-            # sort_keys ensures identical parameter dict arrangements generate the same key
-            key_string = json.dumps(kwargs, sort_keys=True, default=str)
-            return hashlib.md5(key_string.encode("utf-8"), usedforsecurity=False).hexdigest()
-        except Exception as e:
-            logger.error(f"Cache key generation tracking failure: {str(e)}")
-            return hashlib.md5(str(kwargs).encode("utf-8"), usedforsecurity=False).hexdigest()
+        return tuple(sorted(kwargs.items()))
 
     def get(self, **kwargs) -> Optional[Any]:
         """Fetch item matching parameter keys from the synchronized buffer layer."""
@@ -46,28 +39,30 @@ class CacheManager:
             cached_item = self._cache.get(key)
             if cached_item is not None:
                 # If it's wrapped in a custom TTL tracker tuple, process it
-                if isinstance(cached_item, tuple) and len(cached_item) == 3 and cached_item[2] == "custom_expiry":
-                    value, expiry, _ = cached_item
+                if isinstance(cached_item, tuple) and len(cached_item) == 4 and cached_item[2] == "custom_expiry":
+                    value, expiry, _, _ = cached_item
                     if time.time() > expiry:
                         del self._cache[key]
-                        logger.info(f"Cache custom expiration hit for key: {key}")
+                        logger.info("Cache custom expiration hit for key: %s", key)
                         return None
-                    logger.info(f"Cache HIT (Custom TTL) for identifier block: {key}")
+                    logger.info("Cache HIT (Custom TTL) for identifier block: %s", key)
                     return value
 
-                logger.info(f"Cache HIT for identifier block: {key}")
+                logger.info("Cache HIT for identifier block: %s", key)
                 return cached_item
 
-        logger.info(f"Cache MISS for identifier block: {key}")
+        logger.info("Cache MISS for identifier block: %s", key)
         return None
 
-    def set(self, value: Any, ttl: Optional[int] = None, **kwargs) -> None:
+    def set(self, value: Any, ttl: Optional[int] = None, soft_ttl: Optional[float] = None, **kwargs) -> None:
         """
         Store value directly inside the locked memory cache layer.
 
         Args:
             value (Any): Payload to be cached.
             ttl (Optional[int]): Custom override value in seconds for this specific item's life scope.
+            soft_ttl (Optional[float]): Seconds after which the item is still served but may be reported
+                as stale by `is_stale`, so callers can refresh it in the background. Requires `ttl`.
         """
         if value is None:
             return
@@ -78,12 +73,48 @@ class CacheManager:
             if ttl is not None:
                 # FIXED: Instead of altering the read-only global cache.ttl,
                 # we store a custom expiry timestamp inside the value tuple wrapper
-                expiry = time.time() + ttl
-                self._cache[key] = (value, expiry, "custom_expiry")
+                now = time.time()
+                refresh_at = now + soft_ttl if soft_ttl is not None else None
+                self._cache[key] = (value, now + ttl, "custom_expiry", refresh_at)
             else:
                 self._cache[key] = value
 
-        logger.info(f"Cache record successfully set for key: {key}")
+        logger.info("Cache record successfully set for key: %s", key)
+
+    def is_stale(self, **kwargs) -> bool:
+        """
+        Report whether a live item inside its soft TTL window should be refreshed now.
+
+        The chance rises linearly from zero at the soft deadline to certainty at hard expiry,
+        so processes holding the same entry spread their refreshes out instead of expiring in lockstep.
+        """
+        key = self._generate_key(**kwargs)
+
+        with self._lock:
+            cached_item = self._cache.get(key)
+
+        if not (isinstance(cached_item, tuple) and len(cached_item) == 4 and cached_item[2] == "custom_expiry"):
+            return False
+        _, expiry, _, refresh_at = cached_item
+        if refresh_at is None:
+            return False
+        elapsed = time.time() - refresh_at
+        return elapsed > 0 and random.random() * (expiry - refresh_at) < elapsed
+
+    def get_raw(self, **kwargs) -> Optional[Tuple[bytes, str]]:
+        """Fetch a pre-serialized JSON response body and its ETag stored under the matching parameter keys."""
+        return self.get(raw=True, **kwargs)
+
+    def set_raw(self, body: bytes, etag: str, ttl: Optional[int] = None, **kwargs) -> None:
+        """
+        Store a pre-serialized JSON response body so warm hits skip payload encoding entirely.
+
+        Args:
+            body (bytes): Encoded response body.
+            etag (str): Validator computed from the body once at cache-fill time.
+            ttl (Optional[int]): Custom override value in seconds for this specific item's life scope.
+        """
+        self.set((body, etag), ttl=ttl, raw=True, **kwargs)
 
     def clear(self) -> None:
         """Flushes all operational records completely out of system RAM instantly."""
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+# FORCE DEVELOPMENT ENVIRONMENT STATE FOR TESTING STABILITY
+# This guarantees that the /docs and /openapi.json specs remain visible during testing
+os.environ["DEBUG"] = "True"
+os.environ["CORS_ORIGINS"] = '["*"]'
+
+from app.api.dependencies import get_festival_service
+from app.main import app
+from app.services.festival_service import FestivalService
+from app.utils.cache import CacheManager
+
+# Pre-built full-year collections standing in for a scraped AstroSage calendar
+FESTIVALS_FIXTURE = {
+    "January": [
+        {"date": "January 14, 2026", "day": "Wednesday", "name": "Makar Sankranti", "month": None},
+        {"date": "January 26, 2026", "day": "Monday", "name": "Republic Day", "month": None}
+    ],
+    "March": [
+        {"date": "March 4, 2026", "day": "Wednesday", "name": "Holi", "month": None}
+    ]
+}
+RELIGIOUS_FIXTURE = {
+    "Hindu Festivals": [
+        {"date": "January 14, 2026", "day": "Wednesday", "name": "Makar Sankranti", "month": "January"},
+        {"date": "March 4, 2026", "day": "Wednesday", "name": "Holi", "month": "March"}
+    ],
+    "Government Holidays": [
+        {"date": "January 26, 2026", "day": "Monday", "name": "Republic Day", "month": "January"}
+    ],
+    "Sikh Festivals": [],
+    "Christian Holidays": [],
+    "Islamic Holidays": []
+}
+
+
+class FakeFestivalService(FestivalService):
+    """Festival service serving the fixture collections instead of scraping upstream."""
+
+    async def _get_year_data(self, year: int):
+        return FESTIVALS_FIXTURE, RELIGIOUS_FIXTURE, "fixture"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared test client; entering it runs the application lifespan once for the whole session."""
+    fake_service = FakeFestivalService(cache_manager=CacheManager())
+    app.dependency_overrides[get_festival_service] = lambda: fake_service
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
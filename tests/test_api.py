@@ -1,19 +1,13 @@
-import os
-
 import pytest
-from fastapi.testclient import TestClient
-
-# FORCE DEVELOPMENT ENVIRONMENT STATE FOR TESTING STABILITY
-# This guarantees that the /docs and /openapi.json specs remain visible during testing
-os.environ["DEBUG"] = "True"
-os.environ["CORS_ORIGINS"] = '["*"]'
 
-from app.main import app
+from app.api.routes import etag_matches
+from app.config import get_settings
+from app.middleware.rate_limiter import limiter
 
-client = TestClient(app)
+settings = get_settings()
 
 
-def test_root():
+def test_root(client):
     """Test structural welcome message and endpoint metadata connectivity."""
     response = client.get("/")
     assert response.status_code == 200
@@ -22,7 +16,7 @@ def test_root():
     assert "version" in data
 
 
-def test_health_check():
+def test_health_check(client):
     """Test Render automated deployment lifecycle live health probe line."""
     response = client.get("/health")
     assert response.status_code == 200
@@ -32,78 +26,135 @@ def test_health_check():
     assert "version" in data
 
 
-def test_get_festivals_valid_year():
-    """Test getting festivals for a valid year boundary context constraint."""
-    response = client.get("/api/v1/festivals/2026")
+@pytest.mark.parametrize(
+    "url, expected_month",
+    [
+        ("/api/v1/festivals/2026", None),
+        ("/api/v1/festivals/2026?month=1", 1),
+        ("/api/v1/festivals/2026/month/1", 1),
+    ]
+)
+def test_get_festivals(client, url, expected_month):
+    """Test getting festivals for a year, filtered by query argument or explicit month path."""
+    response = client.get(url)
     assert response.status_code == 200
     data = response.json()
-    assert "year" in data
     assert "festivals" in data
     assert data["year"] == 2026
+    assert data["month"] == expected_month
 
 
-def test_get_festivals_with_month():
-    """Test getting festivals filtered by a valid month search query argument."""
-    response = client.get("/api/v1/festivals/2026?month=1")
+def test_get_festivals_content_type(client):
+    """Test that orjson-encoded festival bodies are served as plain JSON."""
+    response = client.get("/api/v1/festivals/2026")
     assert response.status_code == 200
-    data = response.json()
-    assert data["year"] == 2026
-    assert data["month"] == 1
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_get_festivals_not_modified(client):
+    """Test that a repeat poll carrying the served ETag is answered from cache with an empty 304."""
+    etag = client.get("/api/v1/festivals/2026/month/3").headers["etag"]
+    response = client.get("/api/v1/festivals/2026/month/3", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["x-cache"] == "HIT"
+    assert response.content == b""
+
+
+@pytest.mark.parametrize(
+    "url, expected_directive",
+    [
+        ("/api/v1/festivals/2020", "immutable"),
+        ("/api/v1/festivals/2100", "stale-while-revalidate="),
+    ]
+)
+def test_get_festivals_cache_control(client, url, expected_directive):
+    """Test that past years are cached as immutable while current and future years revalidate."""
+    response = client.get(url)
+    assert response.status_code == 200
+    assert "s-maxage=" in response.headers["cache-control"]
+    assert expected_directive in response.headers["cache-control"]
 
 
-def test_get_festivals_invalid_year():
+def test_get_festivals_empty_month_not_stored(client):
+    """Test that an empty past-year month is never pinned by browsers or CDN edges."""
+    response = client.get("/api/v1/festivals/2020/month/5")
+    assert response.status_code == 200
+    assert response.json()["festivals"] == {"May": []}
+    assert response.headers["cache-control"] == "no-store"
+
+
+@pytest.mark.parametrize(
+    "if_none_match, etag, expected",
+    [
+        ('W/"abc"', 'W/"abc"', True),
+        ('"abc"', 'W/"abc"', True),
+        ('W/"abc"', '"abc"', True),
+        ('"xyz", W/"abc"', 'W/"abc"', True),
+        ('"xyz" ,  "abc" ', 'W/"abc"', True),
+        ("*", 'W/"abc"', True),
+        (' * ', 'W/"abc"', True),
+        ('"abd"', 'W/"abc"', False),
+        ('"xyz", W/"abd"', 'W/"abc"', False),
+        ('abc', 'W/"abc"', False),
+        ("", 'W/"abc"', False),
+        (None, 'W/"abc"', False),
+    ]
+)
+def test_etag_matches(if_none_match, etag, expected):
+    """Test weak If-None-Match comparison across single, listed, weak and wildcard validators."""
+    assert etag_matches(if_none_match, etag) is expected
+
+
+def test_get_festivals_invalid_year(client):
     """Test that input validator drops years falling outside historical parameters."""
     response = client.get("/api/v1/festivals/1800")
     assert response.status_code == 422
 
 
-def test_get_festivals_invalid_month():
+def test_get_festivals_invalid_month(client):
     """Test that input validator drops query indexes extending beyond standard limits."""
     response = client.get("/api/v1/festivals/2026?month=13")
     assert response.status_code == 422
 
 
-def test_get_festivals_by_month():
-    """Test explicit calendar index path routing validations."""
-    response = client.get("/api/v1/festivals/2026/month/1")
+@pytest.mark.parametrize(
+    "url, expected_month",
+    [
+        ("/api/v1/festivals/2026/religious", None),
+        ("/api/v1/festivals/2026/religious/month/1", 1),
+    ]
+)
+def test_get_religious_festivals(client, url, expected_month):
+    """Test religious denomination groupings for a year and an explicitly localized month."""
+    response = client.get(url)
     assert response.status_code == 200
     data = response.json()
-    assert data["year"] == 2026
-    assert data["month"] == 1
-
-
-def test_get_religious_festivals():
-    """Test master religious denomination array grouping outputs."""
-    response = client.get("/api/v1/festivals/2026/religious")
-    assert response.status_code == 200
-    data = response.json()
-    assert "year" in data
     assert "religious_festivals" in data
-
-
-def test_get_religious_festivals_by_month():
-    """Test explicitly localized religious group path parameters."""
-    response = client.get("/api/v1/festivals/2026/religious/month/1")
-    assert response.status_code == 200
-    data = response.json()
     assert data["year"] == 2026
-    assert data["month"] == 1
+    assert data["month"] == expected_month
 
 
-def test_rate_limiting():
+def test_rate_limiting(client):
     """Test system defensive rate-limiter layer tracking limits."""
-    responses = [client.get("/api/v1/festivals/2026").status_code for _ in range(5)]
-    # Ensure standard requests connect cleanly under general limits
-    assert 200 in responses
-
-
-def test_cors_headers():
+    try:
+        responses = [
+            client.get("/api/v1/festivals/2026").status_code
+            for _ in range(settings.RATE_LIMIT_REQUESTS + 1)
+        ]
+        # Ensure standard requests connect cleanly under general limits, then trip the real limiter
+        assert 200 in responses
+        assert responses[-1] == 429
+    finally:
+        limiter.reset()
+
+
+def test_cors_headers(client):
     """Test security check returns cross-origin safety configurations."""
     response = client.get("/", headers={"Origin": "https://praveenyadavme.vercel.app"})
     assert "access-control-allow-origin" in response.headers
 
 
-def test_openapi_docs():
+def test_openapi_docs(client):
     """Test that framework docs match target layout expectations during mock mode."""
     response = client.get("/docs")
     assert response.status_code == 200
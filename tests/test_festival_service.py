@@ -0,0 +1,177 @@
+import asyncio
+
+import pytest
+
+from app.services.festival_service import FestivalService
+from app.utils import cache as cache_module
+from app.utils.cache import CacheManager
+
+FESTIVALS = {"January": [{"date": "26", "day": "Monday", "name": "Republic Day", "month": None}]}
+RELIGIOUS = {"Government Holidays": [{"date": "26", "day": "Monday", "name": "Republic Day", "month": "January"}]}
+UPDATED_FESTIVALS = {"January": [{"date": "26", "day": "Monday", "name": "Republic Day (Observed)", "month": None}]}
+
+
+class StubScraper:
+    """Scraper double that counts upstream scrapes and can hold them open until released."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def scrape_year(self, year: int):
+        self.calls += 1
+        result = self.results[min(self.calls, len(self.results)) - 1]
+        await self.release.wait()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def make_service(*results):
+    scraper = StubScraper(*results)
+    return FestivalService(cache_manager=CacheManager(), scraper=scraper), scraper
+
+
+def mark_stale(service: FestivalService, year_data) -> None:
+    """Re-stores the calendar entry with its soft deadline already passed."""
+    service.cache.set(value=year_data, ttl=3600, soft_ttl=-1, type="festival_calendar", year=2026)
+
+
+@pytest.fixture
+def always_refresh(monkeypatch):
+    """Makes the probabilistic early refresh fire on the first draw inside the window."""
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.0)
+
+
+def test_concurrent_misses_share_one_scrape():
+    """Test that concurrent cache misses for a year coalesce onto a single upstream scrape."""
+    async def main():
+        service, scraper = make_service((FESTIVALS, RELIGIOUS, "v1"))
+        scraper.release.clear()
+        pending = [asyncio.create_task(service.get_body("festivals", 2026, month)) for month in (None, 1, 1, 2)]
+        await asyncio.sleep(0)
+        scraper.release.set()
+        results = await asyncio.gather(*pending)
+
+        assert scraper.calls == 1
+        assert results[1][:2] == results[2][:2]
+        assert service._inflight == {}
+
+    asyncio.run(main())
+
+
+def test_cancelled_awaiter_does_not_cancel_shared_scrape():
+    """Test that a disconnecting request leaves the scrape other requests are awaiting running."""
+    async def main():
+        service, scraper = make_service((FESTIVALS, RELIGIOUS, "v1"))
+        scraper.release.clear()
+        cancelled = asyncio.create_task(service.get_festivals(2026))
+        survivor = asyncio.create_task(service.get_festivals(2026))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        scraper.release.set()
+
+        assert await survivor == FESTIVALS
+        assert cancelled.cancelled()
+        assert scraper.calls == 1
+
+    asyncio.run(main())
+
+
+def test_failed_scrape_propagates_to_all_awaiters():
+    """Test that an upstream failure reaches every coalesced request and the next miss retries."""
+    async def main():
+        service, scraper = make_service(RuntimeError("upstream down"), (FESTIVALS, RELIGIOUS, "v1"))
+        results = await asyncio.gather(
+            *(service.get_festivals(2026) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert scraper.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert service._inflight == {}
+        assert await service.get_festivals(2026) == FESTIVALS
+        assert scraper.calls == 2
+
+    asyncio.run(main())
+
+
+def test_stale_hit_serves_old_body_and_schedules_one_refresh(always_refresh):
+    """Test that near-expiry hits return the cached body at once while a single refresh runs."""
+    async def main():
+        year_data = (FESTIVALS, RELIGIOUS, "v1")
+        service, scraper = make_service(year_data, year_data)
+        body, etag, _, _ = await service.get_body("festivals", 2026)
+        mark_stale(service, year_data)
+
+        scraper.release.clear()
+        stale_hits = [await service.get_body("festivals", 2026) for _ in range(5)]
+        assert all(hit == (body, etag, True, True) for hit in stale_hits)
+        assert list(service._inflight) == [2026]
+
+        # Further stale hits while the refresh is still running never start another one
+        await asyncio.sleep(0)
+        stale_hits = [await service.get_body("festivals", 2026) for _ in range(5)]
+        assert all(hit == (body, etag, True, True) for hit in stale_hits)
+        assert scraper.calls == 2
+
+        scraper.release.set()
+        await service._inflight[2026]
+        assert not service.cache.is_stale(type="festival_calendar", year=2026)
+
+    asyncio.run(main())
+
+
+def test_refresh_with_new_content_changes_body_and_etag(always_refresh):
+    """Test that a refresh finding changed data routes requests to a freshly encoded body."""
+    async def main():
+        service, scraper = make_service((FESTIVALS, RELIGIOUS, "v1"), (UPDATED_FESTIVALS, RELIGIOUS, "v2"))
+        body, etag, _, _ = await service.get_body("festivals", 2026)
+        mark_stale(service, (FESTIVALS, RELIGIOUS, "v1"))
+
+        await service.get_body("festivals", 2026)
+        await service._inflight[2026]
+        new_body, new_etag, cache_hit, _ = await service.get_body("festivals", 2026)
+
+        assert b"Republic Day (Observed)" in new_body
+        assert new_body != body
+        assert new_etag != etag
+        assert cache_hit is False
+
+    asyncio.run(main())
+
+
+def test_refresh_with_same_content_keeps_body(always_refresh):
+    """Test that a refresh finding unchanged data keeps serving the cached bytes and ETag."""
+    async def main():
+        year_data = (FESTIVALS, RELIGIOUS, "v1")
+        service, _ = make_service(year_data, year_data)
+        first = await service.get_body("festivals", 2026)
+        mark_stale(service, year_data)
+
+        await service.get_body("festivals", 2026)
+        await service._inflight[2026]
+
+        assert await service.get_body("festivals", 2026) == (first[0], first[1], True, True)
+
+    asyncio.run(main())
+
+
+def test_is_stale_probability(monkeypatch):
+    """Test that staleness is never reported before the soft deadline and is drawn inside the window."""
+    cache = CacheManager()
+    cache.set(value="fresh", ttl=3600, soft_ttl=3000, type="fresh")
+    cache.set(value="due", ttl=3600, soft_ttl=-1, type="due")
+    cache.set(value="plain", type="plain")
+
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.0)
+    assert not cache.is_stale(type="fresh")
+    assert cache.is_stale(type="due")
+    assert not cache.is_stale(type="plain")
+
+    # One second into a one-hour window, a high draw keeps serving without a refresh
+    monkeypatch.setattr(cache_module.random, "random", lambda: 0.99)
+    assert not cache.is_stale(type="due")
@@ -0,0 +1,114 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.scraper import IndianFestivalsScraper
+
+# Small AstroSage-shaped calendar exercising the parser's edge cases
+CALENDAR_HTML = """
+<html><body>
+<table>
+  <thead><tr><th>January 2026</th></tr></thead>
+  <tbody>
+    <tr><td>1 Thursday</td><td><b style="color:#4A3475;">New Year</b></td></tr>
+    <tr><td>14 Wednesday</td><td><a style="COLOR: #A60000">Makar Sankranti</a></td></tr>
+    <tr><td>20 Tuesday</td><td><b style="background-color:#a60000">Highlighted Only</b></td></tr>
+    <tr><td></td><td>Missing date</td></tr>
+    <tr><td>Lonely</td><td>Missing weekday</td></tr>
+    <tr><td>31 Saturday</td></tr>
+  </tbody>
+</table>
+<table><tr><td>1 Sunday</td><td><b style="color:#a60000">No header table</b></td></tr></table>
+<table>
+  <thead><tr><th>February 2026</th></tr></thead>
+  <tr><td>15 Sunday</td><td><b style="color:#a60000">No body table</b></td></tr>
+</table>
+<table>
+  <thead><tr><th>March 2026</th></tr></thead>
+  <tbody>
+    <tr><td>4 Wednesday</td><td><b style="background-color:#fff; color:#a60000">Holi</b></td></tr>
+    <tr><td>21 Saturday</td><td><b style="color:#008000">Eid ul-Fitr</b> <b style="color:#556a21">Hola Mohalla</b></td></tr>
+  </tbody>
+</table>
+</body></html>
+"""
+
+
+def scrape(html: str = CALENDAR_HTML):
+    """Runs a full scrape of the given page through a mocked upstream transport."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text=html)))
+    return asyncio.run(IndianFestivalsScraper(client=client).scrape_year(2026))
+
+
+def test_scrape_year_festivals():
+    """Test that valid rows are kept per month while malformed rows and header-less or body-less tables are skipped."""
+    festivals, _, _ = scrape()
+    assert list(festivals) == ["January", "March"]
+    assert [festival["name"] for festival in festivals["January"]] == [
+        "New Year", "Makar Sankranti", "Highlighted Only"
+    ]
+    assert festivals["January"][0] == {"date": "1", "day": "Thursday", "name": "New Year", "month": None}
+    assert festivals["March"][1]["name"] == "Eid ul-Fitr Hola Mohalla"
+
+
+def test_scrape_year_religious_colors():
+    """Test that mixed-case hex codes resolve while background-color look-alikes are ignored."""
+    _, religious, _ = scrape()
+    assert list(religious) == list(IndianFestivalsScraper.FESTIVAL_COLORS.values())
+    assert [festival["name"] for festival in religious["Hindu Festivals"]] == ["Makar Sankranti", "Holi"]
+    assert religious["Government Holidays"] == [
+        {"date": "1", "day": "Thursday", "name": "New Year", "month": "January"}
+    ]
+    assert [festival["name"] for festival in religious["Islamic Holidays"]] == ["Eid ul-Fitr"]
+    assert [festival["name"] for festival in religious["Sikh Festivals"]] == ["Hola Mohalla"]
+    assert religious["Christian Holidays"] == []
+
+
+def test_scrape_year_empty_page():
+    """Test that a page without calendar tables yields empty collections."""
+    festivals, religious, fingerprint = scrape("<html><body><p>Maintenance</p></body></html>")
+    assert festivals == {}
+    assert religious == {}
+    assert fingerprint
+
+
+def test_scrape_year_xml_declaration():
+    """Test that a page served with an XML encoding declaration parses like a plain HTML page."""
+    festivals, religious, fingerprint = scrape('<?xml version="1.0" encoding="utf-8"?>' + CALENDAR_HTML)
+    assert (festivals, religious, fingerprint) == scrape()
+
+
+def test_fingerprint_ignores_markup_churn():
+    """Test that the data fingerprint tracks festival rows, not unrelated page markup."""
+    _, _, fingerprint = scrape()
+    _, _, churned = scrape(CALENDAR_HTML.replace("<body>", "<body><div>Ad rotated at 12:00</div>"))
+    _, _, edited = scrape(CALENDAR_HTML.replace("Holi", "Holika Dahan"))
+    assert churned == fingerprint
+    assert edited != fingerprint
+
+
+@pytest.mark.parametrize(
+    "month, expected",
+    [
+        (None, ["January", "March"]),
+        (1, ["January"]),
+        (2, []),
+    ]
+)
+def test_filter_festivals(month, expected):
+    """Test slicing the full-year festival collection by month."""
+    festivals, _, _ = scrape()
+    assert list(IndianFestivalsScraper.filter_festivals(festivals, month)) == expected
+
+
+def test_filter_religious_festivals():
+    """Test that month filtering keeps every religion group and blanks the per-item month label."""
+    _, religious, _ = scrape()
+    assert IndianFestivalsScraper.filter_religious_festivals(religious) is religious
+
+    march = IndianFestivalsScraper.filter_religious_festivals(religious, 3)
+    assert list(march) == list(religious)
+    assert march["Hindu Festivals"] == [{"date": "4", "day": "Wednesday", "name": "Holi", "month": None}]
+    assert march["Government Holidays"] == []
+    assert IndianFestivalsScraper.filter_religious_festivals({}, 3) == {}